@@ -0,0 +1,200 @@
+# Бенчмарк генерации расписания на синтетических данных.
+#
+#   python benchmarks/bench_generate.py --scales 50,500,5000 --engines greedy,backtracking \
+#       --output bench.json [--compare previous.json]
+#
+# Для каждого размера создаётся временная база SQLite (или BENCH_DATABASE_URL), генерация запускается через
+# тестовый клиент Flask, замеряются время, число SQL-запросов, пиковая память и
+# доля поставленных часов. --compare печатает изменения относительно прошлого JSON.
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TMP_DIR = tempfile.mkdtemp(prefix='scheduler-bench-')
+atexit.register(shutil.rmtree, TMP_DIR, ignore_errors=True)
+# BENCH_DATABASE_URL=postgresql://... гоняет тот же прогон на PostgreSQL; таблицы в ней пересоздаются
+os.environ['DATABASE_URL'] = os.environ.get('BENCH_DATABASE_URL') or 'sqlite:///' + os.path.join(TMP_DIR, 'bench.db')
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+
+from app import app, db, User, Teacher, Group, Room, Course, DAYS_PER_WEEK, SLOTS_PER_DAY  # noqa: E402
+
+ROOM_TYPES = ['lecture_hall', 'lecture_hall', 'computer_lab']
+PASSWORD = 'bench'
+
+
+def build_instance(courses_count, seed, availability):
+    rnd = random.Random(seed)
+    db.drop_all()
+    db.create_all()
+
+    user = User(username='bench', email='bench@example.com')
+    user.set_password(PASSWORD)
+    db.session.add(user)
+    db.session.commit()
+
+    # Номера дней недели из календаря (FLASK_SCHEDULE_DAYS), как в preferred_days
+    day_numbers = [str(d) for d in range(1, DAYS_PER_WEEK + 1)]
+    teachers = [{
+        'name': f'Преподаватель {i}',
+        'max_hours': rnd.randint(3, 6),
+        'preferred_days': ','.join(sorted(rnd.sample(day_numbers, rnd.randint(2, DAYS_PER_WEEK)))) if rnd.random() < 0.7 else '',
+        'user_id': user.id
+    } for i in range(max(1, courses_count // 6))]
+    groups = [{
+        'name': f'Группа {i}',
+        'size': rnd.randint(15, 30),
+        'max_hours': rnd.randint(4, 6),
+        'user_id': user.id
+    } for i in range(max(1, courses_count // 10))]
+    rooms = [{
+        'name': f'Аудитория {i}',
+        'capacity': rnd.choice([20, 30, 60, 120]),
+        'type': ROOM_TYPES[i % len(ROOM_TYPES)],
+        'schedule': ','.join(''.join('1' if rnd.random() < availability else '0' for _ in range(SLOTS_PER_DAY))
+                             for _ in range(DAYS_PER_WEEK)),
+        'user_id': user.id
+    } for i in range(max(len(ROOM_TYPES), courses_count // 12))]
+
+    db.session.execute(Teacher.__table__.insert(), teachers)
+    db.session.execute(Group.__table__.insert(), groups)
+    db.session.execute(Room.__table__.insert(), rooms)
+    teacher_ids = [row[0] for row in db.session.query(Teacher.id)]
+    group_ids = [row[0] for row in db.session.query(Group.id)]
+
+    courses = [{
+        'name': f'Курс {i}',
+        'type': rnd.choice(['lecture', 'practice']),
+        'hours': rnd.randint(1, 4),
+        'teacher_id': rnd.choice(teacher_ids),
+        'group_id': rnd.choice(group_ids),
+        'room_type': rnd.choice(ROOM_TYPES),
+        'user_id': user.id
+    } for i in range(courses_count)]
+    db.session.execute(Course.__table__.insert(), courses)
+    db.session.commit()
+
+    return {'courses': len(courses), 'teachers': len(teachers), 'groups': len(groups), 'rooms': len(rooms)}
+
+
+def generate(client, engine):
+    response = client.post('/api/generate-schedule', json={'engine': engine, 'wait': True})
+    data = response.get_json()
+    if not data.get('success'):
+        raise RuntimeError(f'Генерация не удалась: {data.get("error")}')
+    return data
+
+
+def run_case(courses_count, engine, seed, availability, measure_memory):
+    with app.app_context():
+        instance = build_instance(courses_count, seed, availability)
+        sql_engine = db.engine
+
+    client = app.test_client()
+    client.post('/login', data={'username': 'bench', 'password': PASSWORD})
+
+    queries = [0]
+
+    def count_query(*args):
+        queries[0] += 1
+
+    event.listen(sql_engine, 'before_cursor_execute', count_query)
+    started = time.perf_counter()
+    try:
+        data = generate(client, engine)
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(sql_engine, 'before_cursor_execute', count_query)
+
+    # tracemalloc заметно замедляет код, поэтому память меряется отдельным прогоном
+    # на тех же данных: генерация каждый раз заменяет расписание целиком
+    peak = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            generate(client, engine)
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return {
+        'scale': courses_count,
+        'engine': engine,
+        'instance': instance,
+        'wall_time': round(elapsed, 4),
+        'queries': queries[0],
+        'peak_memory_kb': round(peak / 1024) if peak is not None else None,
+        'hours_requested': data['hours_requested'],
+        'hours_placed': data['hours_placed'],
+        'placement_rate': round(data['hours_placed'] / data['hours_requested'], 4) if data['hours_requested'] else 1.0
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, previous_path):
+    with open(previous_path, encoding='utf-8') as f:
+        previous = {(r['scale'], r['engine']): r for r in json.load(f)['results']}
+
+    print(f'\nСравнение с {previous_path}:')
+    for result in results:
+        old = previous.get((result['scale'], result['engine']))
+        if not old:
+            continue
+        ratio = result['wall_time'] / old['wall_time'] if old['wall_time'] else float('inf')
+        print(f"  {result['engine']:>12} x{result['scale']:<6} время {ratio:.2f}x, "
+              f"запросов {old['queries']} -> {result['queries']}, "
+              f"размещено {old['placement_rate']:.1%} -> {result['placement_rate']:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Бенчмарк генерации расписания')
+    parser.add_argument('--scales', default='50,500,5000', help='числа курсов через запятую')
+    parser.add_argument('--engines', default='greedy', help='алгоритмы через запятую')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--availability', type=float, default=0.85, help='доля доступных слотов аудиторий')
+    parser.add_argument('--no-memory', action='store_true', help='не мерить пиковую память')
+    parser.add_argument('--output', help='куда сохранить результаты в JSON')
+    parser.add_argument('--compare', help='предыдущий JSON с результатами для сравнения')
+    args = parser.parse_args()
+
+    results = []
+    for scale in (int(s) for s in args.scales.split(',')):
+        for engine in args.engines.split(','):
+            result = run_case(scale, engine, args.seed, args.availability, not args.no_memory)
+            results.append(result)
+            print(f"{engine:>12} x{scale:<6} {result['wall_time']:8.3f} s  {result['queries']:6} запросов  "
+                  f"{result['peak_memory_kb'] or '-':>8} КБ  размещено {result['placement_rate']:.1%}")
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': args.seed,
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
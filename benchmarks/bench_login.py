@@ -0,0 +1,155 @@
+# Бенчмарк входа и загрузки пользователя.
+#
+#   python benchmarks/bench_login.py --methods scrypt,pbkdf2:sha256:600000,pbkdf2:sha256:100000 \
+#       --stored-method scrypt --logins 20 --requests 500 --output login.json
+#
+# Для каждого метода хэширования (PASSWORD_HASH_METHOD) пользователи создаются с уже
+# сохранённым хэшем --stored-method (по умолчанию — как у существующих баз, scrypt Werkzeug),
+# первый вход пересчитывает хэш, если он слабее метода, последующие входы меряются
+# с тем хэшем, который остался в базе. Отдельно меряется авторизованный запрос /api/stats с кэшем пользователей
+# и без него: время и число SQL-запросов на запрос.
+import argparse
+import atexit
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TMP_DIR = tempfile.mkdtemp(prefix='scheduler-bench-')
+atexit.register(shutil.rmtree, TMP_DIR, ignore_errors=True)
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(TMP_DIR, 'bench.db')
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+
+from app import app, db, User  # noqa: E402
+
+PASSWORD = 'bench-password'
+DEFAULT_METHOD = app.config['PASSWORD_HASH_METHOD']
+
+
+def build_users(count, stored_method):
+    db.drop_all()
+    db.create_all()
+    app.config['PASSWORD_HASH_METHOD'] = stored_method
+    for i in range(count):
+        user = User(username=f'user{i}', email=f'user{i}@example.com')
+        user.set_password(PASSWORD)
+        db.session.add(user)
+    db.session.commit()
+
+
+def login(client, username):
+    started = time.perf_counter()
+    response = client.post('/login', data={'username': username, 'password': PASSWORD})
+    elapsed = time.perf_counter() - started
+    if response.status_code != 302:
+        raise RuntimeError(f'Вход не удался: {response.status_code}')
+    return elapsed
+
+
+def run_login_case(method, stored_method, logins):
+    with app.app_context():
+        build_users(logins, stored_method)
+    app.config['PASSWORD_HASH_METHOD'] = method
+
+    # Первый вход каждого пользователя — проверка сохранённого хэша и пересчёт, если он слабее
+    first = [login(app.test_client(), f'user{i}') for i in range(logins)]
+    # Повторные входы — только проверка хэша, оставшегося в базе
+    repeat = [login(app.test_client(), f'user{i}') for i in range(logins)]
+
+    with app.app_context():
+        rehashed = sum(1 for user in User.query.all() if not user.password_needs_rehash())
+
+    return {
+        'method': method,
+        'stored_method': stored_method,
+        'logins': logins,
+        'first_login_ms': round(statistics.median(first) * 1000, 2),
+        'login_ms': round(statistics.median(repeat) * 1000, 2),
+        'logins_per_second': round(1 / statistics.median(repeat), 1),
+        'rehashed': rehashed
+    }
+
+
+def run_request_case(ttl, requests):
+    app.config['USER_CACHE_TTL'] = ttl
+    client = app.test_client()
+    login(client, 'user0')
+    client.get('/api/stats')
+
+    with app.app_context():
+        sql_engine = db.engine
+    queries = [0]
+
+    def count_query(*args):
+        queries[0] += 1
+
+    event.listen(sql_engine, 'before_cursor_execute', count_query)
+    started = time.perf_counter()
+    try:
+        for _ in range(requests):
+            client.get('/api/stats')
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(sql_engine, 'before_cursor_execute', count_query)
+
+    return {
+        'user_cache_ttl': ttl,
+        'requests': requests,
+        'request_ms': round(elapsed / requests * 1000, 3),
+        'queries_per_request': round(queries[0] / requests, 2)
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Бенчмарк входа и загрузки пользователя')
+    parser.add_argument('--methods', default=f'{DEFAULT_METHOD},pbkdf2:sha256:600000,pbkdf2:sha256:100000',
+                        help='методы хэширования через запятую')
+    parser.add_argument('--stored-method', default='scrypt', help='метод хэшей, уже сохранённых в базе')
+    parser.add_argument('--logins', type=int, default=20, help='входов на метод')
+    parser.add_argument('--requests', type=int, default=500, help='авторизованных запросов на вариант кэша')
+    parser.add_argument('--output', help='куда сохранить результаты в JSON')
+    args = parser.parse_args()
+
+    logins = []
+    for method in args.methods.split(','):
+        result = run_login_case(method, args.stored_method, args.logins)
+        logins.append(result)
+        print(f"{method:>24}  вход {result['login_ms']:8.2f} мс  ({result['logins_per_second']:7.1f}/с)  "
+              f"первый вход с пересчётом {result['first_login_ms']:8.2f} мс")
+
+    requests = []
+    for ttl in (0, app.config['USER_CACHE_TTL'] or 30):
+        result = run_request_case(ttl, args.requests)
+        requests.append(result)
+        print(f"{'кэш пользователей ' + (str(ttl) + ' с' if ttl else 'выключен'):>24}  "
+              f"/api/stats {result['request_ms']:7.3f} мс  {result['queries_per_request']} запросов")
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'logins': logins,
+        'requests': requests
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
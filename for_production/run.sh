@@ -1,4 +1,5 @@
 #!/bin/bash
 export FLASK_APP=app.py
 export FLASK_ENV=production
-gunicorn --bind 0.0.0.0:8000 app:app --workers 4 --timeout 120
\ No newline at end of file
+flask db-upgrade
+gunicorn --bind 0.0.0.0:8000 app:app --workers 4 --worker-class gthread --threads 8 --timeout 120
\ No newline at end of file
@@ -0,0 +1,54 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TMP_DIR = tempfile.mkdtemp(prefix='scheduler-test-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(TMP_DIR, 'test.db')
+sys.path.insert(0, ROOT)
+
+import app as scheduler  # noqa: E402
+
+PASSWORD = 'test-password'
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def app():
+    scheduler.app.config.update(TESTING=True, PASSWORD_HASH_METHOD='pbkdf2:sha256:1000')
+    with scheduler.app.app_context():
+        scheduler.db.drop_all()
+        scheduler.db.create_all()
+    # Кэши процесса переживают пересоздание базы
+    scheduler.user_cache.clear()
+    scheduler.response_cache.clear()
+    scheduler.schedule_indexes.clear()
+    yield scheduler.app
+
+
+def create_user(username, is_admin=False):
+    with scheduler.app.app_context():
+        user = scheduler.User(username=username, email=f'{username}@example.com', is_admin=is_admin)
+        user.set_password(PASSWORD)
+        scheduler.db.session.add(user)
+        scheduler.db.session.commit()
+        return user.id
+
+
+def login(app, username):
+    client = app.test_client()
+    response = client.post('/login', data={'username': username, 'password': PASSWORD})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def client(app):
+    create_user('user')
+    return login(app, 'user')
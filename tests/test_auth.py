@@ -0,0 +1,26 @@
+from conftest import PASSWORD, create_user, login, scheduler
+
+
+def stored_hash(username):
+    with scheduler.app.app_context():
+        return scheduler.User.query.filter_by(username=username).one().password_hash
+
+
+def test_login_keeps_stronger_hash(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'scrypt')
+    create_user('user')
+    monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000')
+
+    before = stored_hash('user')
+    login(app, 'user')
+    assert stored_hash('user') == before
+
+
+def test_login_rehashes_weaker_hash(app, monkeypatch):
+    create_user('user')
+    monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'pbkdf2:sha256:2000')
+
+    login(app, 'user')
+    assert stored_hash('user').startswith('pbkdf2:sha256:2000$')
+    with app.app_context():
+        assert scheduler.User.query.one().check_password(PASSWORD)
@@ -0,0 +1,32 @@
+import pytest
+
+from conftest import scheduler
+
+FIVE_DAYS = ','.join(['1111111'] * 4 + ['0000000'])
+
+
+@pytest.fixture
+def six_day_week(monkeypatch):
+    # Как FLASK_SCHEDULE_DAYS=6 после того, как база заполнялась при пятидневной неделе
+    monkeypatch.setattr(scheduler, 'DAYS_PER_WEEK', 6)
+    monkeypatch.setattr(scheduler, 'HORIZON_DAYS', 6 * scheduler.WEEKS)
+    monkeypatch.setattr(scheduler, 'GRID_SIZE', 6 * scheduler.WEEKS * scheduler.SLOTS_PER_DAY)
+    scheduler.parse_room_schedule.cache_clear()
+    yield
+    scheduler.parse_room_schedule.cache_clear()
+
+
+def test_five_day_room_schedule_keeps_new_day_available(six_day_week):
+    mask = scheduler.parse_room_schedule(FIVE_DAYS)
+
+    assert mask & scheduler.day_mask(5) == scheduler.day_mask(5)
+    assert not mask & scheduler.day_mask(4)
+    assert mask == scheduler.parse_room_schedule(FIVE_DAYS + ',1111111')
+
+
+def test_import_accepts_five_day_room_schedule(six_day_week, client):
+    response = client.post('/api/import/rooms', json=[{'name': 'R1', 'schedule': FIVE_DAYS}])
+    assert response.status_code == 200, response.get_json()
+
+    with scheduler.app.app_context():
+        assert scheduler.Room.query.one().schedule == FIVE_DAYS + ',1111111'
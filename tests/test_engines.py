@@ -0,0 +1,92 @@
+import random
+import time
+from collections import Counter
+
+import pytest
+
+from conftest import scheduler
+
+ROOM_TYPES = ['lecture_hall', 'computer_lab']
+
+
+def synthetic_problem(courses_count, seed=1):
+    # Как в benchmarks/bench_generate.py, но без базы: спецификации строятся сразу
+    rnd = random.Random(seed)
+    teachers = max(1, courses_count // 6)
+    groups = max(1, courses_count // 10)
+    teacher_days = [sorted(rnd.sample(range(scheduler.DAYS_PER_WEEK), rnd.randint(2, scheduler.DAYS_PER_WEEK)))
+                    for _ in range(teachers)]
+    teacher_limits = [rnd.randint(3, 6) for _ in range(teachers)]
+    group_limits = [rnd.randint(4, 6) for _ in range(groups)]
+    rooms = [scheduler.RoomSpec(i, ROOM_TYPES[i % len(ROOM_TYPES)], (1 << scheduler.GRID_SIZE) - 1)
+             for i in range(max(len(ROOM_TYPES), courses_count // 12))]
+
+    courses = []
+    for i in range(courses_count):
+        teacher, group = rnd.randrange(teachers), rnd.randrange(groups)
+        hours, room_type = rnd.randint(1, 4), rnd.choice(ROOM_TYPES)
+        for week in range(scheduler.WEEKS):
+            courses.append(scheduler.CourseSpec(
+                i, f'Курс {i}', hours, teacher, group, room_type,
+                tuple(week * scheduler.DAYS_PER_WEEK + day for day in teacher_days[teacher]),
+                teacher_limits[teacher], group_limits[group], week))
+    return scheduler.ScheduleProblem(courses, rooms)
+
+
+def test_backtracking_respects_time_budget():
+    problem = synthetic_problem(10000)
+    budget = 0.3
+
+    started = time.perf_counter()
+    result = scheduler.BacktrackingEngine(time_budget=budget).solve(problem)
+    elapsed = time.perf_counter() - started
+
+    # Без бюджета этот прогон идёт несколько секунд; по истечении бюджета
+    # оставшиеся часы ставятся жадно, за линейное время
+    assert elapsed < budget + 1.5
+    greedy = scheduler.GreedyEngine().solve(problem)
+    assert result.hours_placed >= 0.95 * greedy.hours_placed
+
+
+def full_week():
+    return tuple(range(scheduler.DAYS_PER_WEEK))
+
+
+@pytest.mark.parametrize('shared', ['group', 'room'])
+def test_backtracking_places_most_constrained_course_first(shared):
+    # Курс с одним днём и курс на все остальные позиции делят группу (или единственную
+    # аудиторию); в порядке БД жадный алгоритм занимает первым курсом и единственный день второго
+    capacity = scheduler.DAYS_PER_WEEK * scheduler.SLOTS_PER_DAY
+    second_group = 1 if shared == 'group' else 2
+    problem = scheduler.ScheduleProblem(
+        [scheduler.CourseSpec(1, 'Везде', capacity - scheduler.SLOTS_PER_DAY, 1, 1, 'lecture_hall',
+                              full_week(), None, None, 0),
+         scheduler.CourseSpec(2, 'Понедельник', scheduler.SLOTS_PER_DAY, 2, second_group, 'lecture_hall',
+                              (0,), None, None, 0)],
+        [scheduler.RoomSpec(1, 'lecture_hall', (1 << scheduler.GRID_SIZE) - 1)])
+
+    assert scheduler.GreedyEngine().solve(problem).hours_placed < capacity
+    result = scheduler.BacktrackingEngine().solve(problem)
+    assert result.hours_placed == capacity
+    assert len({(day, slot) for day, slot, course, room_id in result.placements}) == capacity
+
+
+def test_backtracking_fills_tight_daily_limits():
+    # У группы 2 занятия в день, всего 10 за неделю — ровно столько, сколько часов у курсов.
+    # Курс преподавателя, работающего только в пн и вт, должен получить эти дни целиком
+    problem = scheduler.ScheduleProblem(
+        [scheduler.CourseSpec(1, 'Всю неделю', 6, 2, 1, 'lecture_hall', full_week(), 6, 2, 0),
+         scheduler.CourseSpec(2, 'Пн и вт', 4, 1, 1, 'lecture_hall', (0, 1), 2, 2, 0)],
+        [scheduler.RoomSpec(1, 'lecture_hall', (1 << scheduler.GRID_SIZE) - 1)])
+
+    assert scheduler.GreedyEngine().solve(problem).hours_placed < 10
+    result = scheduler.BacktrackingEngine().solve(problem)
+    assert result.hours_placed == 10
+
+    teachers, groups = Counter(), Counter()
+    for day, slot, course, room_id in result.placements:
+        teachers[course.teacher_id, day] += 1
+        groups[course.group_id, day] += 1
+    assert all(teachers[teacher_id, day] <= limit
+               for teacher_id, limit in ((1, 2), (2, 6)) for day in range(scheduler.DAYS_PER_WEEK))
+    assert max(groups.values()) <= 2
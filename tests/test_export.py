@@ -0,0 +1,40 @@
+import re
+
+from conftest import scheduler
+
+
+def insert_slots(app, order):
+    with app.app_context():
+        courses = {course.name: course for course in scheduler.Course.query.all()}
+        room = scheduler.Room.query.one()
+        scheduler.ScheduleSlot.query.delete()
+        for name in order:
+            course = courses[name]
+            scheduler.db.session.add(scheduler.ScheduleSlot(
+                day=ord(name) - ord('A'), slot=0, course_id=course.id, teacher_id=course.teacher_id,
+                group_id=course.group_id, room_id=room.id, user_id=course.user_id))
+        scheduler.db.session.commit()
+        return scheduler.Group.query.one().id
+
+
+def events(client, group_id):
+    body = client.get(f'/api/export/group/{group_id}.ics?start=2026-09-07').get_data(as_text=True)
+    return dict(re.findall(r'UID:(\S+)\r\nDTSTAMP:\S+\r\nDTSTART:(\S+)', body))
+
+
+def test_ics_uid_survives_regeneration(app, client):
+    client.post('/api/import/teachers', json=[{'name': 'T1'}])
+    client.post('/api/import/groups', json=[{'name': 'G1'}])
+    client.post('/api/import/rooms', json=[{'name': 'R1'}])
+    client.post('/api/import/courses', json=[{'name': name, 'hours': 1, 'teacher': 'T1', 'group': 'G1'}
+                                             for name in ('A', 'B')])
+
+    group_id = insert_slots(app, 'AB')
+    before = events(client, group_id)
+    # Пересозданные строки получают те же id, но в другом порядке
+    insert_slots(app, 'BA')
+    after = events(client, group_id)
+
+    assert len(before) == 2
+    assert after == before
+    assert all(uid.endswith('@localhost') for uid in before)
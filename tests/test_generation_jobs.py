@@ -0,0 +1,95 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import scheduler
+
+db = scheduler.db
+
+
+class IdleExecutor:
+    # Задачи не запускаются: остаются queued, пока идут параллельные запросы
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, func, *args):
+        self.submitted.append(args)
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = IdleExecutor()
+    monkeypatch.setattr(scheduler, 'job_executor', executor)
+    return executor
+
+
+def active_jobs(app):
+    with app.app_context():
+        return scheduler.GenerationJob.query.filter(
+            scheduler.GenerationJob.status.in_(('queued', 'running'))).all()
+
+
+def test_concurrent_generation_requests_share_one_job(app, client, executor):
+    requests = 8
+    barrier = threading.Barrier(requests)
+    job_ids = []
+    errors = []
+
+    def submit():
+        with app.test_client() as thread_client:
+            # Сессия входа общая с основным клиентом
+            thread_client.set_cookie('session', client.get_cookie('session').value)
+            barrier.wait()
+            response = thread_client.post('/api/generate-schedule', json={})
+            if response.status_code == 202:
+                job_ids.append(response.get_json()['job_id'])
+            else:
+                errors.append(response.get_json())
+
+    threads = [threading.Thread(target=submit) for _ in range(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(set(job_ids)) == 1
+    assert len(executor.submitted) == 1
+    assert len(active_jobs(app)) == 1
+
+
+def test_stale_job_does_not_block_new_one(app, client, executor):
+    first = client.post('/api/generate-schedule', json={}).get_json()['job_id']
+    assert client.post('/api/generate-schedule', json={}).get_json()['job_id'] == first
+
+    with app.app_context():
+        job = db.session.get(scheduler.GenerationJob, first)
+        job.updated_at = datetime.utcnow() - timedelta(seconds=app.config['JOB_STALE_AFTER'] + 1)
+        db.session.commit()
+
+    second = client.post('/api/generate-schedule', json={}).get_json()['job_id']
+    assert second != first
+    with app.app_context():
+        assert db.session.get(scheduler.GenerationJob, first).status == 'failed'
+    assert [job.id for job in active_jobs(app)] == [second]
+    # Воркер прерванной задачи стартует позже новой: он не должен её запускать
+    scheduler.run_generation_job(first)
+    with app.app_context():
+        assert db.session.get(scheduler.GenerationJob, first).status == 'failed'
+    assert [job.id for job in active_jobs(app)] == [second]
+
+
+def test_worker_records_unexpected_failure(app, client, executor, monkeypatch):
+    job_id = client.post('/api/generate-schedule', json={}).get_json()['job_id']
+
+    def broken(job):
+        raise RuntimeError('database is locked')
+
+    monkeypatch.setattr(scheduler, 'execute_generation_job', broken)
+    scheduler.run_generation_job(job_id)
+
+    with app.app_context():
+        job = db.session.get(scheduler.GenerationJob, job_id)
+        assert job.status == 'failed' and job.error == 'database is locked'
+    assert active_jobs(app) == []
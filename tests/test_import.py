@@ -0,0 +1,33 @@
+import pytest
+
+from conftest import scheduler
+
+# Вторая строка с ошибкой: вместимость не число
+ROWS = [{'name': 'R1', 'capacity': 30}, {'name': 'R2', 'capacity': 'много'}]
+
+
+def room_names(app):
+    with app.app_context():
+        return sorted(room.name for room in scheduler.Room.query.all())
+
+
+@pytest.mark.parametrize('flag', ['1', 'true', 'yes'])
+def test_strict_import_with_errors_is_rolled_back(app, client, flag):
+    response = client.post(f'/api/import/rooms?strict={flag}', json=ROWS)
+
+    assert response.status_code == 400
+    report = response.get_json()
+    assert not report['success'] and report['created'] == 0
+    assert [error['row'] for error in report['errors']] == [2]
+    assert room_names(app) == []
+
+
+@pytest.mark.parametrize('query', ['', '?strict=0', '?strict=false', '?strict=no'])
+def test_lenient_import_keeps_valid_rows(app, client, query):
+    response = client.post(f'/api/import/rooms{query}', json=ROWS)
+
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report['success'] and report['created'] == 1
+    assert [error['row'] for error in report['errors']] == [2]
+    assert room_names(app) == ['R1']
@@ -0,0 +1,113 @@
+from datetime import datetime
+
+from werkzeug.security import generate_password_hash
+
+from conftest import PASSWORD, login, scheduler
+
+db = scheduler.db
+
+# Схема базы, созданной исходной версией приложения (до schema_version)
+BASELINE_SCHEMA = [
+    '''CREATE TABLE user (
+        id INTEGER NOT NULL, username VARCHAR(80) NOT NULL, email VARCHAR(120) NOT NULL,
+        password_hash VARCHAR(256) NOT NULL, is_admin BOOLEAN,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id), UNIQUE (username), UNIQUE (email))''',
+    '''CREATE TABLE teacher (
+        id INTEGER NOT NULL, name VARCHAR(100) NOT NULL, max_hours INTEGER, preferred_days VARCHAR(50),
+        user_id INTEGER NOT NULL, PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES user (id))''',
+    '''CREATE TABLE "group" (
+        id INTEGER NOT NULL, name VARCHAR(50) NOT NULL, size INTEGER, max_hours INTEGER,
+        user_id INTEGER NOT NULL, PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES user (id))''',
+    '''CREATE TABLE room (
+        id INTEGER NOT NULL, name VARCHAR(50) NOT NULL, capacity INTEGER, type VARCHAR(20),
+        schedule VARCHAR(100), user_id INTEGER NOT NULL,
+        PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES user (id))''',
+    '''CREATE TABLE course (
+        id INTEGER NOT NULL, name VARCHAR(100) NOT NULL, type VARCHAR(20), hours INTEGER,
+        teacher_id INTEGER, group_id INTEGER, room_type VARCHAR(20), user_id INTEGER NOT NULL,
+        PRIMARY KEY (id), FOREIGN KEY(teacher_id) REFERENCES teacher (id),
+        FOREIGN KEY(group_id) REFERENCES "group" (id), FOREIGN KEY(user_id) REFERENCES user (id))''',
+    '''CREATE TABLE schedule_slot (
+        id INTEGER NOT NULL, day INTEGER, slot INTEGER, course_id INTEGER, teacher_id INTEGER,
+        group_id INTEGER, room_id INTEGER, user_id INTEGER NOT NULL, PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES course (id), FOREIGN KEY(teacher_id) REFERENCES teacher (id),
+        FOREIGN KEY(group_id) REFERENCES "group" (id), FOREIGN KEY(room_id) REFERENCES room (id),
+        FOREIGN KEY(user_id) REFERENCES user (id))''',
+]
+
+
+def create_baseline_database(slots):
+    db.drop_all()
+    with db.engine.begin() as conn:
+        for ddl in BASELINE_SCHEMA:
+            conn.execute(db.text(ddl))
+        conn.execute(db.text('INSERT INTO user (id, username, email, password_hash, is_admin) '
+                             'VALUES (1, :name, :email, :hash, 0)'),
+                     {'name': 'user', 'email': 'user@example.com', 'hash': generate_password_hash(PASSWORD)})
+        conn.execute(db.text("INSERT INTO teacher (id, name, max_hours, preferred_days, user_id) "
+                             "VALUES (1, 'T', 4, '', 1)"))
+        conn.execute(db.text('INSERT INTO "group" (id, name, size, max_hours, user_id) VALUES (1, \'G\', 20, 6, 1)'))
+        conn.execute(db.text("INSERT INTO room (id, name, capacity, type, schedule, user_id) "
+                             "VALUES (1, 'R', 30, 'lecture_hall', '1111111,1111111,1111111,1111111,1111111', 1)"))
+        conn.execute(db.text("INSERT INTO course (id, name, type, hours, teacher_id, group_id, room_type, user_id) "
+                             "VALUES (1, 'C', 'lecture', 2, 1, 1, 'lecture_hall', 1)"))
+        for day, slot in slots:
+            conn.execute(db.text('INSERT INTO schedule_slot (day, slot, course_id, teacher_id, group_id, room_id, '
+                                 'user_id) VALUES (:day, :slot, 1, 1, 1, 1, 1)'), {'day': day, 'slot': slot})
+
+
+def indexes(table):
+    return {index['name']: index for index in db.inspect(db.engine).get_indexes(table)}
+
+
+def test_upgrade_from_baseline_schema(app):
+    with app.app_context():
+        create_baseline_database([(0, 1), (2, 3)])
+        assert scheduler.migrate_database() == len(scheduler.MIGRATIONS)
+
+        columns = {c['name'] for c in db.inspect(db.engine).get_columns('schedule_slot')}
+        assert {'week', 'pinned'} <= columns
+        assert 'organization_id' in {c['name'] for c in db.inspect(db.engine).get_columns('user')}
+
+        slot_indexes = indexes('schedule_slot')
+        assert slot_indexes['ix_schedule_slot_room']['column_names'] == ['user_id', 'week', 'day', 'slot', 'room_id']
+        assert slot_indexes['ix_schedule_slot_room']['unique']
+        assert 'ix_user_organization_id' in indexes('user')
+        assert 'ix_teacher_user_id' in indexes('teacher')
+
+        # Повторный запуск ничего не меняет
+        assert scheduler.migrate_database() == len(scheduler.MIGRATIONS)
+
+    client = login(app, 'user')
+    schedule = client.get('/api/schedule').get_json()
+    assert schedule['total_slots'] == 2
+    response = client.post('/api/generate-schedule', json={'wait': True})
+    assert response.get_json()['success']
+
+
+def test_upgrade_keeps_duplicate_slots_with_non_unique_index(app):
+    with app.app_context():
+        create_baseline_database([(0, 1), (0, 1)])
+        scheduler.migrate_database()
+        assert not indexes('schedule_slot')['ix_schedule_slot_room']['unique']
+        assert db.session.query(scheduler.ScheduleSlot).count() == 2
+
+
+def test_active_job_index_closes_duplicate_jobs(app):
+    with app.app_context():
+        db.session.execute(db.text('DROP INDEX ix_generation_job_active'))
+        user = scheduler.User(username='user', email='user@example.com')
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.flush()
+        for job_id, created_at in (('old', '2024-01-01 10:00:00'), ('new', '2024-01-01 11:00:00')):
+            db.session.add(scheduler.GenerationJob(id=job_id, status='queued', user_id=user.id,
+                                                   created_at=datetime.fromisoformat(created_at)))
+        db.session.add(scheduler.SchemaVersion(version=scheduler.MIGRATIONS.index(scheduler.add_active_job_index)))
+        db.session.commit()
+
+        scheduler.migrate_database()
+        statuses = {job.id: job.status for job in scheduler.GenerationJob.query.all()}
+        assert statuses == {'old': 'failed', 'new': 'queued'}
+        assert indexes('generation_job')['ix_generation_job_active']['unique']
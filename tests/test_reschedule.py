@@ -0,0 +1,48 @@
+from collections import Counter
+
+import pytest
+
+from conftest import scheduler
+
+
+def slot_rows(app):
+    with app.app_context():
+        return {row.id: row for row in scheduler.ScheduleSlot.query.all()}
+
+
+@pytest.fixture
+def generated(client):
+    client.post('/api/import/teachers', json=[{'name': 'T1', 'preferred_days': '1,2,3'}, {'name': 'T2'}])
+    client.post('/api/import/groups', json=[{'name': 'G1'}])
+    client.post('/api/import/rooms', json=[{'name': 'R1'}, {'name': 'R2'}])
+    client.post('/api/import/courses', json=[{'name': 'A', 'hours': 4, 'teacher': 'T1', 'group': 'G1'},
+                                             {'name': 'B', 'hours': 4, 'teacher': 'T2', 'group': 'G1'}])
+    assert client.post('/api/generate-schedule', json={'wait': True}).get_json()['hours_placed'] == 8
+
+
+def test_reschedule_moves_only_entity_slots(app, client, generated):
+    with app.app_context():
+        teacher_id = scheduler.Teacher.query.filter_by(name='T1').one().id
+    before = {slot_id: (row.week, row.day, row.slot, row.room_id)
+              for slot_id, row in slot_rows(app).items() if row.teacher_id != teacher_id}
+
+    # Преподаватель больше не работает в понедельник–среду: его занятия недопустимы
+    client.post('/api/import/teachers', json=[{'name': 'T1', 'preferred_days': '4,5'}])
+    result = client.post('/api/reschedule', json={'entity': 'teacher', 'id': teacher_id}).get_json()
+    assert result['success']
+    assert result['freed'] == 4 and result['placed'] == 4
+
+    rows = slot_rows(app)
+    assert {slot_id: (row.week, row.day, row.slot, row.room_id)
+            for slot_id, row in rows.items() if row.teacher_id != teacher_id} == before
+    assert {row.day for row in rows.values() if row.teacher_id == teacher_id} <= {3, 4}
+    for field in ('teacher_id', 'group_id', 'room_id'):
+        busy = Counter((row.week, row.day, row.slot, getattr(row, field)) for row in rows.values())
+        assert max(busy.values()) == 1
+
+
+@pytest.mark.parametrize('payload', [{}, {'id': None}, {'id': 'abc'}])
+def test_reschedule_rejects_bad_id(client, payload):
+    response = client.post('/api/reschedule', json={'entity': 'teacher', **payload})
+    assert response.status_code == 400
+    assert not response.get_json()['success']
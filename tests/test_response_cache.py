@@ -0,0 +1,33 @@
+from conftest import scheduler
+
+
+def test_unchanged_data_revalidates_with_304(client):
+    first = client.get('/api/schedule')
+    etag = first.headers['ETag']
+    assert client.get('/api/schedule', headers={'If-None-Match': etag}).status_code == 304
+
+    # Другой процесс (пустой кэш) с тем же кодом отдаёт тот же ETag
+    scheduler.response_cache.clear()
+    assert client.get('/api/schedule', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_changed_body_with_same_data_version_gets_new_etag(client, monkeypatch):
+    etag = client.get('/api/schedule').headers['ETag']
+
+    # Новая версия приложения с другим форматом ответа при той же версии данных
+    scheduler.response_cache.clear()
+    timeslots = scheduler.create_timeslots()
+    monkeypatch.setattr(scheduler, 'create_timeslots', lambda: timeslots + [{'id': 99}])
+
+    response = client.get('/api/schedule', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.get_json()['timeslots'][-1] == {'id': 99}
+
+
+def test_data_change_invalidates_etag(client):
+    etag = client.get('/api/teachers').headers['ETag']
+    client.post('/api/teachers', json={'name': 'T'})
+    response = client.get('/api/teachers', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert [teacher['name'] for teacher in response.get_json()] == ['T']
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from conftest import scheduler
+
+
+@pytest.fixture
+def restart_pool(monkeypatch):
+    monkeypatch.setitem(scheduler.app.config, 'RESTART_WORKERS', 1)
+    yield
+    if scheduler.restart_pool is not None:
+        scheduler.restart_pool.shutdown()
+        scheduler.restart_pool = None
+
+
+def fill_courses(client):
+    client.post('/api/import/teachers', json=[{'name': 'T1'}, {'name': 'T2'}])
+    client.post('/api/import/groups', json=[{'name': 'G1'}, {'name': 'G2'}])
+    client.post('/api/import/rooms', json=[{'name': 'R1'}, {'name': 'R2'}])
+    client.post('/api/import/courses', json=[
+        {'name': 'C1', 'hours': 3, 'teacher': 'T1', 'group': 'G1'},
+        {'name': 'C2', 'hours': 2, 'teacher': 'T2', 'group': 'G2'},
+    ])
+
+
+get_restart_pool = scheduler.get_restart_pool
+
+
+def break_pool():
+    # Процесс пула умирает, как при OOM: пул переходит в состояние BrokenProcessPool
+    pool = get_restart_pool()
+    with pytest.raises(scheduler.BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+    return pool
+
+
+def test_generation_recovers_from_broken_restart_pool(client, restart_pool):
+    fill_courses(client)
+    broken = break_pool()
+
+    for _ in range(2):
+        result = client.post('/api/generate-schedule', json={'wait': True, 'restarts': 2}).get_json()
+        assert result['success']
+        assert result['hours_placed'] == 5
+    assert scheduler.restart_pool is not broken
+
+
+def test_restarts_fall_back_to_single_solve(app, client, restart_pool, monkeypatch):
+    fill_courses(client)
+    monkeypatch.setattr(scheduler, 'get_restart_pool', break_pool)
+
+    with app.app_context():
+        problem = scheduler.load_problem(scheduler.User.query.one().id)
+    result = scheduler.solve_restarts('greedy', problem, {}, 3)
+    assert result.hours_placed == 5
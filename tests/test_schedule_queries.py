@@ -0,0 +1,69 @@
+from sqlalchemy import event
+
+from conftest import scheduler
+
+db = scheduler.db
+
+
+def fill_schedule(client, lessons):
+    # Каждое занятие — свой курс, преподаватель, группа и аудитория, чтобы
+    # ленивая загрузка связей проявилась ростом числа запросов
+    with scheduler.app.app_context():
+        user_id = scheduler.User.query.filter_by(username='user').one().id
+        for i in range(lessons):
+            teacher = scheduler.Teacher(name=f'T{i}', user_id=user_id)
+            group = scheduler.Group(name=f'G{i}', user_id=user_id)
+            room = scheduler.Room(name=f'R{i}', user_id=user_id)
+            db.session.add_all([teacher, group, room])
+            db.session.flush()
+            course = scheduler.Course(name=f'C{i}', teacher_id=teacher.id, group_id=group.id, user_id=user_id)
+            db.session.add(course)
+            db.session.flush()
+            db.session.add(scheduler.ScheduleSlot(
+                day=i % scheduler.DAYS_PER_WEEK, slot=i % scheduler.SLOTS_PER_DAY, course_id=course.id,
+                teacher_id=teacher.id, group_id=group.id, room_id=room.id, user_id=user_id))
+        scheduler.bump_data_version(user_id)
+        db.session.commit()
+
+
+def count_schedule_queries(client):
+    # Пользователь попадает в кэш первым запросом после входа, его загрузку не считаем
+    client.get('/api/stats')
+    with scheduler.app.app_context():
+        engine = db.engine
+    queries = []
+
+    def count_query(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count_query)
+    try:
+        response = client.get('/api/schedule')
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_query)
+    assert response.status_code == 200
+    return response.get_json(), len(queries)
+
+
+def test_schedule_query_count_does_not_grow_with_schedule(client):
+    fill_schedule(client, 3)
+    small, small_queries = count_schedule_queries(client)
+
+    fill_schedule(client, 60)
+    large, large_queries = count_schedule_queries(client)
+
+    assert small['total_slots'] == 3
+    assert large['total_slots'] == 63
+    assert large_queries == small_queries
+    assert small_queries <= 2
+
+
+def test_schedule_serializes_related_entities(client):
+    fill_schedule(client, 1)
+    data, _ = count_schedule_queries(client)
+    lesson = data['days'][0]['slots'][0][0]
+    assert lesson['course']['name'] == 'C0'
+    assert lesson['course']['teacher_name'] == 'T0'
+    assert lesson['teacher']['name'] == 'T0'
+    assert lesson['group']['name'] == 'G0'
+    assert lesson['room']['name'] == 'R0'
@@ -0,0 +1,62 @@
+import pytest
+
+from conftest import scheduler
+
+
+@pytest.fixture
+def schedule(app, client):
+    # Три занятия курса: два в понедельник с окном между ними и одно во вторник,
+    # вне предпочитаемого дня преподавателя
+    client.post('/api/import/teachers', json=[{'name': 'T1', 'preferred_days': '1'}])
+    client.post('/api/import/groups', json=[{'name': 'G1', 'size': 25}])
+    client.post('/api/import/rooms', json=[{'name': 'R1', 'capacity': 30}])
+    client.post('/api/import/courses', json=[{'name': 'A', 'hours': 4, 'teacher': 'T1', 'group': 'G1'}])
+
+    with app.app_context():
+        course = scheduler.Course.query.one()
+        room = scheduler.Room.query.one()
+        scheduler.db.session.add_all(
+            scheduler.ScheduleSlot(day=day, slot=slot, course_id=course.id, teacher_id=course.teacher_id,
+                                   group_id=course.group_id, room_id=room.id, user_id=course.user_id)
+            for day, slot in ((0, 0), (0, 2), (1, 0)))
+        scheduler.bump_data_version(course.user_id)
+        scheduler.db.session.commit()
+        return {'course': course.id, 'room': room.id}
+
+
+def test_score_reports_missing_hours_and_violations(client, schedule):
+    score = client.get('/api/schedule/score').get_json()
+
+    assert score['lessons'] == 3
+    assert score['hours_requested'] == 4 and score['hours_missing'] == 1
+    assert score['courses_short'] == [{'id': schedule['course'], 'name': 'A', 'requested': 4,
+                                       'placed': 3, 'missing': 1}]
+    assert score['preference_violations'] == {'outside_preferred_days': 1, 'same_day_repeats': 1}
+    assert score['capacity'] == {'wasted_seats': 15, 'overflows': 0, 'seat_utilization': 0.833}
+    assert score['windows'] == {'teacher': 1, 'group': 1}
+
+
+def test_diff_classifies_changes(client):
+    base = [[0, 0, 0, 1, 1], [0, 0, 1, 1, 1], [0, 1, 0, 2, 1]]
+    target = [[0, 0, 0, 1, 2], [0, 3, 3, 1, 1], [0, 4, 0, 3, 1]]
+    result = client.post('/api/schedule/diff', json={'base': base, 'target': target, 'details': True}).get_json()
+
+    assert result['success']
+    assert {key: result[key] for key in ('unchanged', 'room_changed', 'moved', 'added', 'removed')} == {
+        'unchanged': 0, 'room_changed': 1, 'moved': 1, 'added': 1, 'removed': 1}
+    assert result['courses_changed'] == [1, 2, 3]
+    # В позициях — все несовпавшие занятия, включая перенесённые и со сменой аудитории
+    assert result['added_placements'] == target and result['removed_placements'] == base
+
+
+def test_diff_against_snapshot_and_current_schedule(client, schedule):
+    snapshot = client.post('/api/snapshots', json={'name': 'v1'}).get_json()['snapshot']
+
+    result = client.post('/api/schedule/diff', json={'base': snapshot['id']}).get_json()
+    assert result['unchanged'] == 3 and result['courses_changed'] == []
+
+
+@pytest.mark.parametrize('base', [None, 'abc', [[0, 0, 0]], 999])
+def test_diff_rejects_bad_input(client, base):
+    response = client.post('/api/schedule/diff', json={'base': base, 'target': []})
+    assert response.status_code == 400
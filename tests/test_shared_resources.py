@@ -0,0 +1,62 @@
+from conftest import create_user, login, scheduler
+
+db = scheduler.db
+
+
+def join_organization(app, *usernames):
+    create_user('admin', is_admin=True)
+    admin = login(app, 'admin')
+    organization_id = admin.post('/api/organizations', json={'name': 'University'}).get_json()['id']
+    with app.app_context():
+        ids = [scheduler.User.query.filter_by(username=name).one().id for name in usernames]
+    for user_id in ids:
+        response = admin.post(f'/api/organizations/{organization_id}/members', json={'user_id': user_id})
+        assert response.get_json()['success']
+
+
+def test_import_keeps_shared_key_of_later_rows(client):
+    response = client.post('/api/import/teachers', json=[{'name': 'A'}, {'name': 'B', 'shared_key': 'k1'}])
+    assert response.get_json()['created'] == 2
+    response = client.post('/api/import/rooms', json=[{'name': 'R1'}, {'name': 'R2', 'shared_key': 'hall'}])
+    assert response.get_json()['created'] == 2
+
+    teachers = {t['name']: t['shared_key'] for t in client.get('/api/teachers').get_json()}
+    rooms = {r['name']: r['shared_key'] for r in client.get('/api/rooms').get_json()}
+    assert teachers == {'A': None, 'B': 'k1'}
+    assert rooms == {'R1': None, 'R2': 'hall'}
+
+
+def test_import_refreshes_shared_reservations(app, client):
+    join_organization(app, 'user')
+    client.post('/api/import/teachers', json=[{'name': 'T'}])
+    client.post('/api/import/groups', json=[{'name': 'G'}])
+    client.post('/api/import/rooms', json=[{'name': 'R'}])
+    client.post('/api/import/courses', json=[{'name': 'C', 'hours': 3, 'teacher': 'T', 'group': 'G'}])
+    assert client.post('/api/generate-schedule', json={'wait': True}).get_json()['hours_placed'] == 3
+
+    def reservations():
+        with app.app_context():
+            return sorted((r.kind, r.key) for r in scheduler.SharedReservation.query.all())
+
+    assert reservations() == []
+    client.post('/api/import/rooms', json=[{'name': 'R', 'shared_key': 'hall'}])
+    assert reservations() == [('room', 'hall')] * 3
+    client.post('/api/import/teachers', json=[{'name': 'T', 'shared_key': 'prof'}])
+    assert reservations() == [('room', 'hall')] * 3 + [('teacher', 'prof')] * 3
+
+
+def test_import_conflicting_shared_key_is_rejected(app, client):
+    create_user('other')
+    other = login(app, 'other')
+    join_organization(app, 'user', 'other')
+    for department, key in ((client, 'hall'), (other, 'lab')):
+        department.post('/api/import/teachers', json=[{'name': 'T'}])
+        department.post('/api/import/groups', json=[{'name': 'G'}])
+        department.post('/api/import/rooms', json=[{'name': 'R', 'shared_key': key, 'schedule': '1000000,0000000,0000000,0000000,0000000'}])
+        department.post('/api/import/courses', json=[{'name': 'C', 'hours': 1, 'teacher': 'T', 'group': 'G'}])
+        assert department.post('/api/generate-schedule', json={'wait': True}).get_json()['hours_placed'] == 1
+
+    # Обе аудитории заняты в первую пару понедельника: общий ключ сделал бы их одной
+    response = other.post('/api/import/rooms', json=[{'name': 'R', 'shared_key': 'hall'}])
+    assert response.status_code == 409
+    assert [r['shared_key'] for r in other.get('/api/rooms').get_json()] == ['lab']
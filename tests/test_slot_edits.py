@@ -0,0 +1,90 @@
+import pytest
+
+from conftest import scheduler
+
+# Курс: (преподаватель, группа); у T1 дневной лимит — 2 занятия
+COURSES = {'A': ('T1', 'G1'), 'B': ('T2', 'G2'), 'D': ('T1', 'G2'), 'E': ('T2', 'G1')}
+# Занятие: (курс, день, пара, аудитория); A занимает лимит T1 в понедельник
+SLOTS = {'a1': ('A', 0, 0, 'R1'), 'a2': ('A', 0, 1, 'R1'), 'b1': ('B', 1, 0, 'R1'),
+         'd1': ('D', 2, 0, 'R1'), 'e1': ('E', 2, 1, 'R1')}
+
+
+@pytest.fixture
+def slots(app, client):
+    client.post('/api/import/teachers', json=[{'name': 'T1', 'max_hours': 2}, {'name': 'T2'}])
+    client.post('/api/import/groups', json=[{'name': 'G1'}, {'name': 'G2'}])
+    client.post('/api/import/rooms', json=[{'name': 'R1'}, {'name': 'R2'}])
+    client.post('/api/import/courses', json=[{'name': name, 'hours': 2, 'teacher': teacher, 'group': group}
+                                             for name, (teacher, group) in COURSES.items()])
+
+    with app.app_context():
+        user_id = scheduler.User.query.one().id
+        ids = {model: {row.name: row.id for row in model.query.all()}
+               for model in (scheduler.Teacher, scheduler.Group, scheduler.Room, scheduler.Course)}
+        rows = {}
+        for key, (course, day, slot, room) in SLOTS.items():
+            teacher, group = COURSES[course]
+            rows[key] = scheduler.ScheduleSlot(
+                day=day, slot=slot, course_id=ids[scheduler.Course][course],
+                teacher_id=ids[scheduler.Teacher][teacher], group_id=ids[scheduler.Group][group],
+                room_id=ids[scheduler.Room][room], user_id=user_id)
+        scheduler.db.session.add_all(rows.values())
+        scheduler.bump_data_version(user_id)
+        scheduler.db.session.commit()
+        return {'slots': {key: row.id for key, row in rows.items()}, 'rooms': ids[scheduler.Room]}
+
+
+def positions(app):
+    with app.app_context():
+        return {row.id: (row.week, row.day, row.slot, row.room_id) for row in scheduler.ScheduleSlot.query.all()}
+
+
+@pytest.mark.parametrize('key, target, room, message', [
+    ('d1', (0, 0), 'R2', 'Преподаватель занят в это время'),
+    ('e1', (0, 0), 'R2', 'Группа занята в это время'),
+    ('b1', (0, 0), 'R1', 'Аудитория занята в это время'),
+    ('d1', (0, 3), 'R2', 'Превышен дневной лимит часов преподавателя'),
+])
+def test_move_into_conflict_is_rejected(app, client, slots, key, target, room, message):
+    before = positions(app)
+    day, slot = target
+    response = client.post(f"/api/schedule/slots/{slots['slots'][key]}/move",
+                           json={'day': day, 'slot': slot, 'room_id': slots['rooms'][room]})
+
+    assert response.status_code == 409
+    assert message in response.get_json()['conflicts']
+    assert positions(app) == before
+
+
+def test_move_to_free_position(app, client, slots):
+    slot_id = slots['slots']['b1']
+    response = client.post(f'/api/schedule/slots/{slot_id}/move', json={'day': 3, 'slot': 4})
+
+    assert response.status_code == 200
+    assert positions(app)[slot_id] == (0, 3, 4, slots['rooms']['R1'])
+
+
+def test_swap_exchanges_positions(app, client, slots):
+    first, second = slots['slots']['a1'], slots['slots']['b1']
+    response = client.post('/api/schedule/slots/swap', json={'first': first, 'second': second})
+
+    assert response.status_code == 200
+    after = positions(app)
+    assert after[first][:3] == (0, 1, 0)
+    assert after[second][:3] == (0, 0, 0)
+
+
+def test_pinned_slot_survives_generation(app, client, slots):
+    slot_id = slots['slots']['b1']
+    assert client.post(f'/api/schedule/slots/{slot_id}/pin').status_code == 200
+
+    result = client.post('/api/generate-schedule', json={'wait': True}).get_json()
+    assert result['success']
+
+    after = positions(app)
+    assert after[slot_id] == (0, 1, 0, slots['rooms']['R1'])
+    with app.app_context():
+        assert scheduler.db.session.get(scheduler.ScheduleSlot, slot_id).pinned
+        # Закреплённый час засчитан курсу: генерация поставила только недостающий
+        course_id = scheduler.Course.query.filter_by(name='B').one().id
+        assert scheduler.ScheduleSlot.query.filter_by(course_id=course_id).count() == 2
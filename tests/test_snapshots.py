@@ -0,0 +1,55 @@
+import pytest
+
+from conftest import scheduler
+
+
+@pytest.fixture
+def generated(client):
+    client.post('/api/import/teachers', json=[{'name': 'T1'}])
+    client.post('/api/import/groups', json=[{'name': 'G1'}])
+    client.post('/api/import/rooms', json=[{'name': 'R1'}])
+    client.post('/api/import/courses', json=[{'name': 'A', 'hours': 3, 'teacher': 'T1', 'group': 'G1'}])
+    assert client.post('/api/generate-schedule', json={'wait': True}).get_json()['hours_placed'] == 3
+
+
+def placements(client):
+    return client.get('/api/schedule/placements').get_json()['placements']
+
+
+def snapshot_list(client):
+    return client.get('/api/snapshots').get_json()
+
+
+def test_save_and_restore_snapshot(client, generated):
+    saved = placements(client)
+    snapshot = client.post('/api/snapshots', json={'name': 'v1'}).get_json()['snapshot']
+    assert snapshot['name'] == 'v1' and snapshot['lessons'] == 3 and not snapshot['auto']
+
+    detail = client.get(f"/api/snapshots/{snapshot['id']}").get_json()
+    assert detail['placements'] == saved
+
+    client.post('/api/clear-schedule')
+    assert placements(client) == []
+
+    result = client.post(f"/api/snapshots/{snapshot['id']}/restore").get_json()
+    assert result['success'] and result['restored'] == 3 and result['skipped'] == 0
+    # Пустое расписание перед восстановлением не сохраняется
+    assert result['snapshot_id'] is None
+    assert placements(client) == saved
+
+
+def test_autosave_is_deduplicated_by_data_version(client, generated):
+    snapshot = client.post('/api/snapshots', json={'name': 'v1'}).get_json()['snapshot']
+
+    # Данные не менялись после снимка: очистка ссылается на него, а не сохраняет копию
+    cleared = client.post('/api/clear-schedule').get_json()
+    assert cleared['snapshot_id'] == snapshot['id']
+    assert len(snapshot_list(client)) == 1
+
+    client.post(f"/api/snapshots/{snapshot['id']}/restore")
+    client.post('/api/import/courses', json=[{'name': 'A', 'hours': 2, 'teacher': 'T1', 'group': 'G1'}])
+    client.post('/api/generate-schedule', json={'wait': True})
+
+    items = snapshot_list(client)
+    assert len(items) == 2
+    assert items[0]['auto'] and items[0]['lessons'] == 3
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from conftest import scheduler
+
+
+@pytest.fixture
+def stream_limit(monkeypatch):
+    monkeypatch.setitem(scheduler.app.config, 'STATS_STREAM_INTERVAL', 0)
+    monkeypatch.setattr(scheduler, 'stats_streams', scheduler.threading.BoundedSemaphore(1))
+    monkeypatch.setitem(scheduler.app.config, 'STATS_STREAM_MAX_CONNECTIONS', 1)
+
+
+def test_stream_sends_stats(client, stream_limit):
+    response = client.get('/api/stats/stream')
+    try:
+        chunks = iter(response.response)
+        assert next(chunks).startswith(b'retry:')
+        event = next(chunks).decode()
+        assert json.loads(event[len('data: '):])['teachers'] == 0
+        assert next(chunks) == b': ping\n\n'
+    finally:
+        response.close()
+
+
+def test_streams_over_limit_fall_back_to_polling(client, stream_limit):
+    first = client.get('/api/stats/stream')
+    assert first.status_code == 200
+
+    second = client.get('/api/stats/stream')
+    assert second.status_code == 204
+
+    # Закрытый поток освобождает место
+    first.close()
+    third = client.get('/api/stats/stream')
+    assert third.status_code == 200
+    third.close()